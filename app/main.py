@@ -1,8 +1,5 @@
 import streamlit as st
 
-from app.modules.data_fetch import convert_ticker, get_price_and_meta
-from app.modules.indicators import compute_indicators
-
 from app.ui_components import setup_page, render_header_block
 from app.ui_ttab import render_t_tab
 from app.ui_qtab import render_q_tab
@@ -22,11 +19,18 @@ def main():
     user_input = st.text_input(
         "ティッカーを入力（例：7203, 8306.T, AAPL）", value=""
     )
-    ticker = convert_ticker(user_input)
-    if not ticker:
+    # 未入力（初回表示）は重いモジュールを読む前にここで止める
+    if not user_input.strip():
         st.info("ティッカーを入力すると結果が表示されます。")
         st.stop()
 
+    # yfinance / pandas の読み込みは 1 秒近くかかるので、入力欄を描画してから読む
+    # （2 回目以降の rerun は sys.modules から返るだけ）
+    from app.modules.data_fetch import convert_ticker, get_price_and_meta
+    from app.modules.indicators import compute_indicators
+
+    ticker = convert_ticker(user_input)
+
     # --- データ取得 ---
     try:
         base = get_price_and_meta(ticker)
@@ -1,13 +1,41 @@
-from typing import Optional, Tuple, Dict
+from typing import Optional, Tuple, Dict, List, Iterable
+import asyncio
+import json
+import os
 import re
+import threading
 from datetime import datetime, timedelta
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import yfinance as yf
+import numpy as np
 import pandas as pd
 import streamlit as st
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+# 取得系の公開 API はこのモジュールに一本化する。
+# キャッシュ（COMPANY_NAME_CACHE / st.cache_data）はモジュール単位なので、
+# 呼び出し側は app.modules.data_fetch から import し、別名パスで二重に読み込まないこと。
+__all__ = [
+    "COMPANY_NAME_CACHE",
+    "FUNDAMENTALS_TTL",
+    "PRICE_TTL",
+    "COMPANY_NAME_TTL",
+    "convert_ticker",
+    "is_jpx_ticker",
+    "get_jpx_fundamentals_irbank",
+    "get_us_fundamentals_alpha",
+    "get_jpx_fundamentals_irbank_async",
+    "get_us_fundamentals_alpha_async",
+    "get_fundamentals_many",
+    "get_prices_bulk",
+    "get_price_and_meta",
+    "get_price_and_meta_many",
+]
 
 # -----------------------------------------------------------
 # 定数
@@ -15,8 +43,158 @@ import time
 IRBANK_BASE = "https://irbank.net/"
 ALPHA_BASE = "https://www.alphavantage.co/query"
 
+# IRBANK / Alpha Vantage 共通の HTTP セッション（ホストごとに TCP/TLS 接続を再利用）
+# Accept-Encoding は requests の既定値に任せる（brotli が入っていれば br も自動で名乗る。
+# 復号できない br を手で名乗ると本文が壊れるので固定値にはしない）
+_SESSION = requests.Session()
+_SESSION.headers.update(
+    {
+        "User-Agent": "Mozilla/5.0",
+        "Referer": IRBANK_BASE,
+    }
+)
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
+
+# IRBANK『株式指標』の項目ごとのラベル候補（先頭ほど優先：連結 → 単体 → 素のラベル）。
+# 「EPS（連）」が「EPS」より先にマッチするよう、長いラベルを前に並べている。
+_IRBANK_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "eps": ("EPS（連）", "EPS（単）", "EPS"),
+    "bps": ("BPS（連）", "BPS（単）", "BPS"),
+    "per_fwd": ("PER予",),
+    "roe": ("ROE（連）", "ROE"),
+    "roa": ("ROA（連）", "ROA"),
+    "equity_ratio": ("株主資本比率（連）", "株主資本比率"),
+}
+_IRBANK_LABELS = tuple(
+    label for labels in _IRBANK_FIELDS.values() for label in labels
+)
+# 各項目の第一候補。これが全部見つかったら走査を打ち切ってよい
+_IRBANK_PREFERRED = frozenset(labels[0] for labels in _IRBANK_FIELDS.values())
+
+# 数値（カンマ区切り・小数・マイナス対応）
+_NUM_PATTERN = r"-?[\d,]+(?:\.\d+)?"
+
+_NUM_RE = re.compile(_NUM_PATTERN)
+
+# ラベル + 直後の数値を 1 パスで拾う正規表現（import 時に 1 回だけコンパイル）
+_IRBANK_LABEL_RE = re.compile(
+    "(" + "|".join(map(re.escape, _IRBANK_LABELS)) + ")"
+    r"[^0-9\-]{0,40}(" + _NUM_PATTERN + ")"
+)
+
+# IRBANK の <title> に付く「｜株式情報」などの接尾辞（最初に現れた位置で切る）
+_JPX_NAME_SUFFIX_RE = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            (
+                "株価/株式情報",
+                "株価・株式情報",
+                "｜ 株式情報",
+                "｜株式情報",
+                "| 株式情報",
+                "|株式情報",
+                "株式情報",
+            ),
+        )
+    )
+)
+
+# st.cache_data の TTL（秒）。EPS/BPS などは四半期ごとにしか変わらないので長め、
+# 株価は鮮度を優先して短めにする。
+FUNDAMENTALS_TTL = 86400
+PRICE_TTL = 900
+
+# 銘柄名キャッシュの保存先（プロセス再起動後も温まった状態から始められるようにする）。
+# 既定はユーザーのキャッシュディレクトリ。CHECKSIGNAL_CACHE_DIR で変えられる。
+_CACHE_DIR = os.environ.get("CHECKSIGNAL_CACHE_DIR") or os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "checksignal",
+)
+COMPANY_NAME_CACHE_PATH = os.path.join(_CACHE_DIR, "company_names.json")
+# 保存した銘柄名の有効期限（秒）。誤って拾った名前が残り続けないよう、読み込み時に期限切れを捨てる
+COMPANY_NAME_TTL = 30 * 86400
+_COMPANY_NAME_LOCK = threading.Lock()
+
+
+def _load_company_names() -> Tuple[Dict[str, str], Dict[str, float]]:
+    """
+    ディスク上の銘柄名キャッシュを読み、(銘柄名, 保存時刻) を返す。
+    無い・壊れている・期限切れ・旧形式（保存時刻なし）のエントリは読み飛ばす。
+    """
+    try:
+        with open(COMPANY_NAME_CACHE_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}, {}
+    if not isinstance(data, dict):
+        return {}, {}
+
+    names: Dict[str, str] = {}
+    saved_at: Dict[str, float] = {}
+    now = time.time()
+    for key, entry in data.items():
+        if not isinstance(entry, dict):
+            continue
+        name = entry.get("name")
+        ts = entry.get("saved_at")
+        if not isinstance(name, str) or not isinstance(ts, (int, float)):
+            continue
+        if now - ts > COMPANY_NAME_TTL:
+            continue
+        names[str(key)] = name
+        saved_at[str(key)] = float(ts)
+    return names, saved_at
+
+
 # 銘柄名キャッシュ（IRBANK / Alpha Vantage のレスポンスから埋める）
-COMPANY_NAME_CACHE: Dict[str, str] = {}
+COMPANY_NAME_CACHE, _COMPANY_NAME_SAVED_AT = _load_company_names()
+# 保存先に書けなかったら以降はメモリ上だけで持つ（取得のたびにエラーを出さない）
+_company_name_persist = True
+
+
+def _remember_company_name(keys: Iterable[str], name: str) -> None:
+    """
+    銘柄名をメモリ上のキャッシュに入れ、変化があればディスクにも書き出す。
+    ワーカースレッドからも呼ばれるのでロックを取り、一時ファイル経由で置き換える。
+    """
+    global _company_name_persist
+
+    with _COMPANY_NAME_LOCK:
+        changed = False
+        now = time.time()
+        for key in keys:
+            if COMPANY_NAME_CACHE.get(key) != name:
+                COMPANY_NAME_CACHE[key] = name
+                _COMPANY_NAME_SAVED_AT[key] = now
+                changed = True
+        if not changed or not _company_name_persist:
+            return
+
+        data = {
+            key: {"name": value, "saved_at": _COMPANY_NAME_SAVED_AT.get(key, now)}
+            for key, value in COMPANY_NAME_CACHE.items()
+        }
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{COMPANY_NAME_CACHE_PATH}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, COMPANY_NAME_CACHE_PATH)
+        except OSError as e:
+            _company_name_persist = False
+            print(f"[cache] company name cache not writable, keeping it in memory: {e}")
 
 # Streamlit Secrets から Alpha Vantage API キー取得
 ALPHA_VANTAGE_API_KEY: Optional[str] = st.secrets.get(
@@ -52,9 +230,21 @@ def is_jpx_ticker(ticker: str) -> bool:
     return False
 
 
+def _irbank_code(ticker: str) -> str:
+    """"7203.T" → "7203"（IRBANK の URL 用コード）"""
+    return ticker.replace(".T", "") if ticker.endswith(".T") else ticker
+
+
 # -----------------------------------------------------------
 # 共通ユーティリティ
 # -----------------------------------------------------------
+class _TransientFetchError(Exception):
+    """
+    通信エラー・非 2xx・壊れたレスポンスなど、時間を置けば直りうる取得失敗。
+    st.cache_data は例外を保存しないので、キャッシュ付き関数の中ではこれを投げ、
+    キャッシュ無しのラッパー側で全項目 None に変換する（失敗結果を TTL の間残さない）。
+    """
+
 def _safe_float(x) -> Optional[float]:
     try:
         if x is None or x == "":
@@ -64,43 +254,89 @@ def _safe_float(x) -> Optional[float]:
         return None
 
 
-def _compute_dividend_yield(
-    ticker_obj: yf.Ticker, close: float
-) -> Optional[float]:
+def _get_dividends(ticker: str) -> Optional[pd.Series]:
     """
-    yfinance.Ticker.dividends から過去1年分の配当利回り（%）を計算。
+    _fetch_dividends のラッパー。取得に失敗した場合は None を返す。
     """
-    divs = ticker_obj.dividends
-
-    if not isinstance(divs, pd.Series) or len(divs) == 0 or close <= 0:
+    try:
+        return _fetch_dividends(ticker)
+    except _TransientFetchError as e:
+        print(f"[yfinance] {e}")
         return None
 
-    # index を datetime64[ns] に統一
-    divs.index = pd.to_datetime(divs.index, errors="coerce")
-    divs = divs.dropna()
 
-    # タイムゾーン除去
+@st.cache_data(ttl=PRICE_TTL, show_spinner=False)
+def _fetch_dividends(ticker: str) -> pd.Series:
+    """
+    yfinance.Ticker.dividends を取得する（ワーカースレッドから呼ぶ）。
+    通信エラーは _TransientFetchError を投げる（キャッシュには残らない）。
+    """
     try:
-        if getattr(divs.index, "tz", None) is not None:
-            divs.index = divs.index.tz_localize(None)
-    except Exception:
-        pass
+        return yf.Ticker(ticker).dividends
+    except Exception as e:
+        raise _TransientFetchError(f"dividends error ({ticker}): {e}") from e
+
+
+def _dividends_from_df(df: pd.DataFrame) -> Optional[pd.Series]:
+    """
+    yf.download(actions=True) が付ける Dividends 列から配当 Series を取り出す。
+
+    直近1年の配当合計を出すには 1 年前からの履歴が必要なので、
+    先頭行が _compute_dividend_yield_from_series と同じ基準日（今日の 365 日前）より
+    新しい場合は None を返し、Ticker.dividends に任せる。
+    """
+    div_col = next((c for c in df.columns if str(c).startswith("Dividends")), None)
+    if div_col is None or not isinstance(df.index, pd.DatetimeIndex) or len(df) == 0:
+        return None
+
+    first = df.index[0]
+    if first.tzinfo is not None:
+        first = first.tz_localize(None)
+    if first > pd.Timestamp(datetime.now() - timedelta(days=365)):
+        return None
+
+    divs = df[div_col]
+    return divs[divs > 0]
+
+
+def _compute_dividend_yield_from_series(
+    divs: Optional[pd.Series], close: float
+) -> Optional[float]:
+    """
+    取得済みの配当 Series から過去1年分の配当利回り（%）を計算。
+    """
+    if not isinstance(divs, pd.Series) or len(divs) == 0 or close <= 0:
+        return None
 
-    one_year_ago = datetime.now() - timedelta(days=365)
-    one_year_ago = one_year_ago.replace(tzinfo=None)
+    # yfinance は通常 DatetimeIndex を返すので、そうでない場合だけ変換する
+    idx = divs.index
+    if not isinstance(idx, pd.DatetimeIndex):
+        idx = pd.to_datetime(idx, errors="coerce")
 
-    last_year_divs = divs[divs.index >= one_year_ago]
-    if len(last_year_divs) == 0:
+    # タイムゾーン除去（この時点で idx は DatetimeIndex なので例外処理は要らない）
+    if idx.tz is not None:
+        idx = idx.tz_localize(None)
+
+    # index を書き換えずに numpy の真偽マスクで直近1年分を抽出（NaT は False になる）
+    one_year_ago = np.datetime64(datetime.now() - timedelta(days=365))
+    mask = idx.values >= one_year_ago
+    if not mask.any():
         return None
 
-    annual_div = last_year_divs.sum()
+    annual_div = float(np.nansum(divs.to_numpy(dtype=np.float64)[mask]))
     return float(annual_div / close * 100.0) if close > 0 else None
 
 
 def _get_company_name(ticker_obj: yf.Ticker, fallback_ticker: str) -> str:
     """
-    可能なら yfinance を叩く前に、モジュール内キャッシュから銘柄名を取得。
-    なければ最後の手段として yfinance.info を見る。
+    銘柄名を以下の順で解決する。
+
+    1. モジュール内キャッシュ（IRBANK の <title> / Alpha Vantage の Name で埋まる）
+    2. yfinance.info（quoteSummary を叩くため低速。最後の手段）
+
+    ※ yfinance.fast_info は銘柄名を持たないので候補にしない。
+       get_price_and_meta はファンダメンタル取得後にこの関数を呼ぶため、
+       通常は 1 でヒットして .info まで降りてこない。
     """
     key = fallback_ticker.strip().upper()
 
@@ -117,7 +353,12 @@ def _get_company_name(ticker_obj: yf.Ticker, fallback_ticker: str) -> str:
     except Exception:
         name = None
 
-    return name or fallback_ticker
+    if not name:
+        return fallback_ticker
+
+    # 次回以降の再実行では .info を叩かずに済むよう、解決できた名前は覚えておく
+    _remember_company_name([key], name)
+    return name
 
 def _clean_jpx_company_name(name: str) -> str:
     """
@@ -128,20 +369,8 @@ def _clean_jpx_company_name(name: str) -> str:
     if not isinstance(name, str):
         return name
 
-    # 全角・半角バー + 任意スペース + 株式情報
-    patterns = [
-        "株価/株式情報",
-        "株価・株式情報",
-        "｜ 株式情報",
-        "｜株式情報",
-        "| 株式情報",
-        "|株式情報",
-        "株式情報",
-    ]
-
-    for p in patterns:
-        if p in name:
-            name = name.split(p)[0]
+    # 全角・半角バー + 任意スペース + 株式情報（どれか最初に出てきた所より前だけ残す）
+    name = _JPX_NAME_SUFFIX_RE.split(name, maxsplit=1)[0]
 
     # よく残るゴミ文字（全角/半角スペース・バー・ハイフンなど）を削る
     return name.strip(" 　-|｜")
@@ -150,6 +379,98 @@ def _clean_jpx_company_name(name: str) -> str:
 # -----------------------------------------------------------
 # IRBANK から 日本株の EPS/BPS/PER予/ROE/ROA/自己資本比率 を取得
 # -----------------------------------------------------------
+def _parse_irbank_table(soup: BeautifulSoup) -> Dict[str, float]:
+    """
+    指標テーブル（<th>ラベル</th><td>値</td> の並び）から直接ラベル→数値を読む。
+    「円」「%」「倍」などの単位は数値部分だけ拾うことで落とす。
+    """
+    wanted = set(_IRBANK_LABELS)
+    values: Dict[str, float] = {}
+    for tr in soup.select("table tr"):
+        cells = tr.find_all(["th", "td"])
+        for head, cell in zip(cells, cells[1:]):
+            # 見出し行（<th>EPS</th><th>2024/03</th>）の年度などを値として拾わない
+            if head.name != "th" or cell.name != "td":
+                continue
+            label = head.get_text(strip=True)
+            if label not in wanted or label in values:
+                continue
+            m = _NUM_RE.search(cell.get_text(strip=True))
+            if not m:
+                continue
+            try:
+                values[label] = float(m.group(0).replace(",", ""))
+            except ValueError:
+                continue
+    return values
+
+
+def _scan_irbank_text(text: str, values: Dict[str, float]) -> None:
+    """
+    ページ本文を 1 パスで走査し、まだ取れていないラベルの値を values に補う。
+    （ラベルごとに木をたどる代わりに、最初に出てきた値を採用）
+    """
+    for m in _IRBANK_LABEL_RE.finditer(text):
+        label = m.group(1)
+        if label in values:
+            continue
+        try:
+            values[label] = float(m.group(2).replace(",", ""))
+        except ValueError:
+            continue
+        if _IRBANK_PREFERRED.issubset(values):
+            break  # 全項目の第一候補が揃ったので残りは読まない
+
+
+# ストリーミング読み込みの打ち切り判定用（IRBANK は UTF-8 で配信される）
+_IRBANK_PREFERRED_BYTES = tuple(label.encode("utf-8") for label in _IRBANK_PREFERRED)
+_IRBANK_CHUNK_SIZE = 16 * 1024
+# 打ち切り後の残りを読み捨てる上限。ここまでで本文が終われば接続はプールに戻り、
+# 超える場合は接続ごと閉じる（次の IRBANK 取得は TCP/TLS ハンドシェイクからやり直しになる）
+_IRBANK_DRAIN_LIMIT = 256 * 1024
+
+
+def _read_irbank_html(resp: requests.Response) -> bytes:
+    """
+    IRBANK のレスポンス本文をチャンク単位で読み、各項目の優先ラベルが出揃って
+    その後ろの </table> まで届いた時点で打ち切る（後続のチャート・スクリプト・フッターはパースしない）。
+    ラベルが揃わない銘柄は最後まで読むので、従来と同じ入力になる。
+
+    途中で with を抜けると requests は接続をプールに戻さず閉じてしまうので、
+    打ち切った後の残りは _IRBANK_DRAIN_LIMIT まで読み捨ててから返す。
+    """
+    buf = bytearray()
+    pending = set(_IRBANK_PREFERRED_BYTES)
+    last_label_end = 0
+    # チャンク境界をまたぐラベルも拾えるよう、前回の末尾から少し戻って探す
+    overlap = max(len(b) for b in _IRBANK_PREFERRED_BYTES)
+
+    chunks = resp.iter_content(_IRBANK_CHUNK_SIZE)
+    for chunk in chunks:
+        start = max(0, len(buf) - overlap)
+        buf += chunk
+
+        for label in list(pending):
+            pos = buf.find(label, start)
+            if pos >= 0:
+                pending.discard(label)
+                last_label_end = max(last_label_end, pos + len(label))
+
+        if not pending and buf.find(b"</table>", last_label_end) >= 0:
+            break
+    else:
+        return bytes(buf)  # 最後まで読んだ
+
+    # 残りは buf に足さずに読み捨てる（読み切れば接続が再利用される）
+    drained = 0
+    for chunk in chunks:
+        drained += len(chunk)
+        if drained > _IRBANK_DRAIN_LIMIT:
+            break
+
+    return bytes(buf)
+
+
 def get_jpx_fundamentals_irbank(
     code: str,
 ) -> Tuple[
@@ -159,6 +480,29 @@ def get_jpx_fundamentals_irbank(
     Optional[float],  # roe (%)
     Optional[float],  # roa (%)
     Optional[float],  # equity_ratio (%)
+]:
+    """
+    _fetch_jpx_fundamentals_irbank のラッパー。
+    取得に失敗した場合は全項目 None を返す。失敗は st.cache_data に残らず、
+    呼び出し側（get_price_and_meta など）もキャッシュしないので、次の呼び出しで取り直す。
+    """
+    try:
+        return _fetch_jpx_fundamentals_irbank(code)
+    except _TransientFetchError as e:
+        print(f"[IRBANK] {e}")
+        return None, None, None, None, None, None
+
+
+@st.cache_data(ttl=FUNDAMENTALS_TTL, show_spinner=False)
+def _fetch_jpx_fundamentals_irbank(
+    code: str,
+) -> Tuple[
+    Optional[float],  # eps
+    Optional[float],  # bps
+    Optional[float],  # per_fwd
+    Optional[float],  # roe (%)
+    Optional[float],  # roa (%)
+    Optional[float],  # equity_ratio (%)
 ]:
     """
     IRBANK の『株式指標』ページから
@@ -170,21 +514,19 @@ def get_jpx_fundamentals_irbank(
     - 株主資本比率（連）       → 自己資本比率 %
 
     ついでに <title> から会社名を拾ってモジュール内キャッシュに保存する。
+    通信エラー・非 2xx は _TransientFetchError を投げる（キャッシュには残らない）。
     """
     url = f"{IRBANK_BASE}{code}"
-    headers = {
-        "User-Agent": "Mozilla/5.0",
-        "Referer": IRBANK_BASE,
-    }
 
     try:
-        resp = requests.get(url, headers=headers, timeout=10)
-        resp.raise_for_status()
+        with _SESSION.get(url, timeout=10, stream=True) as resp:
+            resp.raise_for_status()
+            html = _read_irbank_html(resp)
     except Exception as e:
-        print(f"[IRBANK] request error ({code}): {e}")
-        return None, None, None, None, None, None
+        raise _TransientFetchError(f"request error ({code}): {e}") from e
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    # bytes のまま lxml に渡す（requests 側の文字コード推定・デコードを省き、<meta charset> に従わせる）
+    soup = BeautifulSoup(html, "lxml")
 
     # 会社名を <title> からざっくり取得してキャッシュ
     try:
@@ -196,56 +538,28 @@ def get_jpx_fundamentals_irbank(
             company_name = _clean_jpx_company_name(raw_name)
             if company_name:
                 # "2801" / "2801.T" どちらで呼ばれても拾えるよう両方キャッシュ
-                COMPANY_NAME_CACHE[code] = company_name
-                COMPANY_NAME_CACHE[f"{code}.T"] = company_name
+                _remember_company_name([code, f"{code}.T"], company_name)
     except Exception as e:
         print(f"[IRBANK] name parse error ({code}): {e}")
 
+    # まず指標テーブルから直接読み、足りない項目だけ本文テキストの走査で補う
+    values = _parse_irbank_table(soup)
+    if not _IRBANK_PREFERRED.issubset(values):
+        _scan_irbank_text(soup.get_text(" ", strip=True), values)
 
-    def extract_number_near(label: str) -> Optional[float]:
-        """
-        ラベル文字列の近くに出てくる数値（% や 円/株 含む）をざっくり抜き出す。
-        """
-        node = soup.find(string=re.compile(re.escape(label)))
-        if not node:
-            return None
-
-        cur = node
-        for _ in range(8):
-            if cur is None:
-                break
-            text = str(cur)
-            m = re.search(r"([\d,]+(?:\.\d+)?)", text)
-            if m:
-                try:
-                    return float(m.group(1).replace(",", ""))
-                except ValueError:
-                    return None
-            cur = cur.find_next(string=True)
-        return None
-
-    # EPS / BPS
-    eps = (
-        extract_number_near("EPS（連）")
-        or extract_number_near("EPS（単）")
-        or extract_number_near("EPS")
-    )
-    bps = (
-        extract_number_near("BPS（連）")
-        or extract_number_near("BPS（単）")
-        or extract_number_near("BPS")
-    )
-
-    # 予想PER（存在しない銘柄もある）
-    per_fwd = extract_number_near("PER予")
+    # 項目ごとに優先順でラベルを見て、最初に取れた（0 以外の）値を採用
+    picked = {
+        field: next((values[l] for l in labels if values.get(l)), None)
+        for field, labels in _IRBANK_FIELDS.items()
+    }
 
+    eps = picked["eps"]
+    bps = picked["bps"]
+    per_fwd = picked["per_fwd"]  # 予想PER（存在しない銘柄もある）
     # ROE / ROA / 自己資本比率（いずれも % 表記）
-    roe = extract_number_near("ROE（連）") or extract_number_near("ROE")
-    roa = extract_number_near("ROA（連）") or extract_number_near("ROA")
-    equity_ratio = (
-        extract_number_near("株主資本比率（連）")
-        or extract_number_near("株主資本比率")
-    )
+    roe = picked["roe"]
+    roa = picked["roa"]
+    equity_ratio = picked["equity_ratio"]
 
     return eps, bps, per_fwd, roe, roa, equity_ratio
 
@@ -253,6 +567,18 @@ def get_jpx_fundamentals_irbank(
 # -----------------------------------------------------------
 # Alpha Vantage から 米株の EPS/BPS/ROE/ROA/自己資本比率(近似) を取得
 # -----------------------------------------------------------
+class _AlphaRateLimited(_TransientFetchError):
+    """Alpha Vantage が Note / Information（回数制限）を返した、またはその待ち時間中であることを表す。"""
+
+
+# 回数制限を受けたら一定時間 Alpha を叩かない（連続で制限されるたびに待ち時間を倍にする）
+_ALPHA_BACKOFF_BASE = 60.0
+_ALPHA_BACKOFF_MAX = 15 * 60.0
+_alpha_backoff = _ALPHA_BACKOFF_BASE
+_next_alpha_attempt = 0.0
+_ALPHA_BACKOFF_LOCK = threading.Lock()
+
+
 def get_us_fundamentals_alpha(
     symbol: str,
 ) -> Tuple[
@@ -261,6 +587,54 @@ def get_us_fundamentals_alpha(
     Optional[float],  # roe (%)
     Optional[float],  # roa (%)
     Optional[float],  # equity_ratio (% approx)
+]:
+    """
+    _fetch_us_fundamentals_alpha のラッパー。
+
+    取得に失敗した場合（回数制限の待ち時間中を含む）は全項目 None を返す。
+    失敗は例外で抜けてくるので st.cache_data には残らない。呼び出し側
+    （get_price_and_meta など）もこの結果をキャッシュしないので、
+    待ち時間が明けた後の最初の呼び出しで取り直される。
+    待ち時間の判定はキャッシュ付き関数の中（HTTP の直前）で行うので、
+    キャッシュ済みの銘柄は制限中でもそのまま返る。
+    """
+    try:
+        return _fetch_us_fundamentals_alpha(symbol)
+    except _TransientFetchError as e:
+        print(f"[Alpha] {e}")
+        return None, None, None, None, None
+
+
+def _alpha_rate_limited(symbol: str, message: str) -> _AlphaRateLimited:
+    """回数制限を受けたので待ち時間を設定して倍にし、投げる例外を返す。"""
+    global _alpha_backoff, _next_alpha_attempt
+
+    with _ALPHA_BACKOFF_LOCK:
+        _next_alpha_attempt = time.monotonic() + _alpha_backoff
+        err = _AlphaRateLimited(
+            f"rate-limited ({symbol}), retry in {_alpha_backoff:.0f}s: {message}"
+        )
+        _alpha_backoff = min(_alpha_backoff * 2, _ALPHA_BACKOFF_MAX)
+    return err
+
+
+def _alpha_succeeded() -> None:
+    """Alpha から正常なレスポンスが返ったので待ち時間を初期値に戻す。"""
+    global _alpha_backoff
+
+    with _ALPHA_BACKOFF_LOCK:
+        _alpha_backoff = _ALPHA_BACKOFF_BASE
+
+
+@st.cache_data(ttl=FUNDAMENTALS_TTL, show_spinner=False)
+def _fetch_us_fundamentals_alpha(
+    symbol: str,
+) -> Tuple[
+    Optional[float],  # eps
+    Optional[float],  # bps
+    Optional[float],  # roe (%)
+    Optional[float],  # roa (%)
+    Optional[float],  # equity_ratio (% approx)
 ]:
     """
     Alpha Vantage の OVERVIEW から
@@ -271,6 +645,7 @@ def get_us_fundamentals_alpha(
     を取得し、ROE/ROA は %、自己資本比率は ROA/ROE から近似値を算出。
 
     併せて "Name" を会社名としてキャッシュする。
+    通信エラー・壊れたレスポンスは _TransientFetchError を投げる（キャッシュには残らない）。
     """
     eps = bps = roe_pct = roa_pct = equity_ratio_pct = None
 
@@ -279,6 +654,10 @@ def get_us_fundamentals_alpha(
         print("[Alpha] API key not set")
         return eps, bps, roe_pct, roa_pct, equity_ratio_pct
 
+    # 回数制限の待ち時間中は Alpha を叩かない（キャッシュにヒットした銘柄はここまで来ない）
+    if time.monotonic() < _next_alpha_attempt:
+        raise _AlphaRateLimited(f"backing off ({symbol})")
+
     params = {
         "function": "OVERVIEW",
         "symbol": symbol,
@@ -286,26 +665,31 @@ def get_us_fundamentals_alpha(
     }
 
     try:
-        resp = requests.get(ALPHA_BASE, params=params, timeout=10)
+        resp = _SESSION.get(ALPHA_BASE, params=params, timeout=10)
         resp.raise_for_status()
     except Exception as e:
-        print(f"[Alpha] request error ({symbol}): {e}")
-        return eps, bps, roe_pct, roa_pct, equity_ratio_pct
+        raise _TransientFetchError(f"request error ({symbol}): {e}") from e
 
     try:
         data = resp.json()
     except Exception as e:
-        print(f"[Alpha] json error ({symbol}): {e}, text={resp.text[:200]}")
-        return eps, bps, roe_pct, roa_pct, equity_ratio_pct
+        raise _TransientFetchError(
+            f"json error ({symbol}): {e}, text={resp.text[:200]}"
+        ) from e
 
     if not isinstance(data, dict) or not data:
-        print(f"[Alpha] unexpected payload ({symbol}): {data}")
-        return eps, bps, roe_pct, roa_pct, equity_ratio_pct
+        raise _TransientFetchError(f"unexpected payload ({symbol}): {data}")
+
+    # 無料枠の回数制限は 200 + {"Note": ...} / {"Information": ...} で返ってくる
+    limit_msg = data.get("Note") or data.get("Information")
+    if limit_msg:
+        raise _alpha_rate_limited(symbol, str(limit_msg)[:200])
+    _alpha_succeeded()
 
     # 会社名をキャッシュ
     name_val = data.get("Name")
     if isinstance(name_val, str) and name_val.strip():
-        COMPANY_NAME_CACHE[symbol.upper()] = name_val.strip()
+        _remember_company_name([symbol.upper()], name_val.strip())
 
     eps_val = _safe_float(data.get("EPS"))
     bps_val = _safe_float(data.get("BookValue"))
@@ -334,34 +718,68 @@ def get_us_fundamentals_alpha(
 
 
 # -----------------------------------------------------------
-# メイン：価格 + メタ情報 + ファンダメンタル
+# 非同期版（複数銘柄のファンダメンタルをまとめて取る用途）
 # -----------------------------------------------------------
-def get_price_and_meta(
-    ticker: str,
-    period: str = "180d",
-    interval: str = "1d",
-):
+async def get_jpx_fundamentals_irbank_async(code: str):
     """
-    - yfinance.download で OHLCV（リトライ付き）
-    - yfinance.Ticker で銘柄名・配当
-    - JPX: IRBANK から EPS/BPS/PER予/ROE/ROA/自己資本比率
-    - US:  Alpha Vantage から EPS/BPS/ROE/ROA/自己資本比率(近似)
+    get_jpx_fundamentals_irbank の非同期版。
+    HTTP と HTML パースをワーカースレッドで実行し、イベントループを塞がない。
+    """
+    return await asyncio.to_thread(get_jpx_fundamentals_irbank, code)
+
+
+async def get_us_fundamentals_alpha_async(symbol: str):
+    """get_us_fundamentals_alpha の非同期版（ワーカースレッドで実行）。"""
+    return await asyncio.to_thread(get_us_fundamentals_alpha, symbol)
+
+
+async def get_fundamentals_many(tickers: List[str]) -> Dict[str, tuple]:
+    """
+    複数ティッカーのファンダメンタルを並列に取得する。
+
+    - JPX: IRBANK（eps, bps, per_fwd, roe, roa, equity_ratio）
+    - US:  Alpha Vantage（eps, bps, roe, roa, equity_ratio）
+
+    戻り値は {変換後ティッカー: 各取得関数のタプル}。
+    """
+    symbols = [t for t in (convert_ticker(x) for x in tickers) if t]
+
+    async def _fetch(t: str) -> tuple:
+        if is_jpx_ticker(t):
+            return await get_jpx_fundamentals_irbank_async(_irbank_code(t))
+        return await get_us_fundamentals_alpha_async(t)
+
+    results = await asyncio.gather(*(_fetch(t) for t in symbols))
+    return dict(zip(symbols, results))
+
+
+# -----------------------------------------------------------
+# 価格データ（yfinance）
+# -----------------------------------------------------------
+def _history_prices(
+    ticker_obj: yf.Ticker, period: str, interval: str
+) -> pd.DataFrame:
+    """
+    Ticker.history で単一銘柄の OHLCV + 配当を取得（リトライ付き）。
+
+    yf.download は 1 銘柄でもスレッドプールや結果の結合を挟むので、
+    単一銘柄は Ticker から直接取る。列名は download と同じ「Close_7203.T」形式に揃える。
     """
     df = None
     last_err: Optional[Exception] = None
 
-    # --- 価格データ（yfinance） リトライ付き ---
     for attempt in range(2):  # 最大 2 回トライ
         try:
-            df = yf.download(ticker, period=period, interval=interval)
+            df = ticker_obj.history(period=period, interval=interval, actions=True)
         except Exception as e:
             last_err = e
             df = pd.DataFrame()
 
-        if not df.empty and len(df) >= 2:
+        if df is not None and not df.empty and len(df) >= 2:
             break  # 成功したのでループ脱出
 
-        time.sleep(1)  # 少し待ってから再トライ
+        if attempt == 0:
+            time.sleep(1)  # 少し待ってから再トライ（最終試行後は待たない）
 
     if df is None or df.empty or len(df) < 2:
         # 例外が取れていればメッセージ付きで返す
@@ -369,7 +787,74 @@ def get_price_and_meta(
             raise ValueError(f"株価データ取得エラー: {last_err}")
         raise ValueError("株価データが取得できませんでした。")
 
-    # ここから下はもう一度ダウンロードしなくてOK
+    df.columns = [f"{col}_{ticker_obj.ticker}" for col in df.columns]
+    return df
+
+
+@st.cache_data(ttl=PRICE_TTL, show_spinner=False)
+def get_prices_bulk(
+    tickers: List[str],
+    period: str = "180d",
+    interval: str = "1d",
+) -> Dict[str, pd.DataFrame]:
+    """
+    複数銘柄の OHLCV を 1 回の yfinance.download でまとめて取得し、
+    銘柄ごとの DataFrame に分割して返す。
+
+    列名は get_price_and_meta と同じ「Close_7203.T」形式に揃える。
+    データが取れなかった銘柄は結果に含めない。
+    """
+    symbols = [t for t in (convert_ticker(x) for x in tickers) if t]
+    if not symbols:
+        return {}
+
+    try:
+        raw = yf.download(
+            " ".join(symbols),
+            period=period,
+            interval=interval,
+            actions=True,
+            group_by="ticker",
+            threads=True,
+            progress=False,
+        )
+    except Exception as e:
+        print(f"[yfinance] bulk download error ({len(symbols)} tickers): {e}")
+        return {}
+
+    if raw is None or raw.empty or not isinstance(raw.columns, pd.MultiIndex):
+        return {}
+
+    frames: Dict[str, pd.DataFrame] = {}
+    available = set(raw.columns.get_level_values(0))
+    for t in symbols:
+        if t not in available:
+            continue
+        # 市場ごとに休場日が違うので、その銘柄の終値が欠けている行は落とす
+        # （actions=True の Dividends / Stock Splits は休場日も 0.0 で埋まることがあるので、
+        #   行全体が欠損かどうかでは判定しない）
+        sub = raw[t]
+        if "Close" not in sub.columns:
+            continue
+        sub = sub.dropna(subset=["Close"])
+        if len(sub) < 2:
+            continue
+        sub.columns = [f"{col}_{t}" for col in sub.columns]
+        frames[t] = sub
+
+    return frames
+
+
+# -----------------------------------------------------------
+# メイン：価格 + メタ情報 + ファンダメンタル
+# -----------------------------------------------------------
+def _price_fields(df: pd.DataFrame) -> dict:
+    """
+    取得済みの OHLCV を検証し、終値・前日終値・期間高安を取り出す。
+
+    不正なティッカーはここで ValueError になるので、
+    ファンダメンタル系の HTTP は一切叩かれない。
+    """
     if isinstance(df.columns, pd.MultiIndex):
         df.columns = ["_".join(col).strip() for col in df.columns]
 
@@ -378,16 +863,42 @@ def get_price_and_meta(
     except StopIteration:
         raise ValueError("終値（Close）列が見つかりませんでした。")
 
-    if len(df[close_col]) < 2:
+    # 終値は numpy 配列として 1 回だけ取り出し、以降の集計はすべてこれで行う
+    arr = df[close_col].to_numpy(dtype=np.float64)
+    if arr.size < 2:
         raise ValueError("データ日数が不足しています（2営業日未満）。")
 
-    close = float(df[close_col].iloc[-1])
-    previous_close = float(df[close_col].iloc[-2])
+    close = float(arr[-1])
+    previous_close = float(arr[-2])
+
+    # 終値が不正ならこの時点で打ち切る（IRBANK / Alpha / yfinance.info は叩かない）
+    if not close > 0:
+        raise ValueError("終値が取得できませんでした（0 以下または欠損）。")
 
-    high_52w = float(df[close_col].max())
-    low_52w = float(df[close_col].min())
+    # pandas の max/min と同じく欠損値は無視する
+    high_52w = float(np.nanmax(arr))
+    low_52w = float(np.nanmin(arr))
+
+    return {
+        "df": df,
+        "close_col": close_col,
+        "close": close,
+        "previous_close": previous_close,
+        "high_52w": high_52w,
+        "low_52w": low_52w,
+    }
+
+
+def _attach_meta(ticker: str, prices: dict) -> dict:
+    """
+    _price_fields の結果に銘柄名・配当・ファンダメンタルを付けて返す。
+
+    IRBANK / Alpha Vantage / 配当はそれぞれ自前の st.cache_data を持ち、
+    失敗時は None になるだけでキャッシュには残らない。
+    ここ自体はキャッシュしないので、復旧すれば次の呼び出しで値が入る。
+    """
+    close = prices["close"]
 
-    # --- ここから下は今のあなたのコードをそのまま ---
     eps: Optional[float] = None
     bps: Optional[float] = None
     per_fwd: Optional[float] = None
@@ -396,8 +907,24 @@ def get_price_and_meta(
     roa_pct: Optional[float] = None
     equity_ratio_pct: Optional[float] = None
 
-    if is_jpx_ticker(ticker):
-        code_for_irbank = ticker.replace(".T", "") if ticker.endswith(".T") else ticker
+    is_jpx = is_jpx_ticker(ticker)
+
+    # download(actions=True) の Dividends 列で足りれば Ticker.dividends は叩かない
+    divs = _dividends_from_df(prices["df"])
+
+    # IRBANK / Alpha Vantage と yfinance の配当取得は互いに独立した I/O なので並列に投げる
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        if is_jpx:
+            fund_future = pool.submit(get_jpx_fundamentals_irbank, _irbank_code(ticker))
+        else:
+            fund_future = pool.submit(get_us_fundamentals_alpha, ticker)
+        divs_future = None if divs is not None else pool.submit(_get_dividends, ticker)
+
+        fundamentals = fund_future.result()
+        if divs_future is not None:
+            divs = divs_future.result()
+
+    if is_jpx:
         (
             eps,
             bps,
@@ -405,7 +932,7 @@ def get_price_and_meta(
             roe_pct,
             roa_pct,
             equity_ratio_pct,
-        ) = get_jpx_fundamentals_irbank(code_for_irbank)
+        ) = fundamentals
 
         if per_fwd not in (None, 0.0) and close > 0:
             eps_fwd = close / per_fwd
@@ -416,19 +943,14 @@ def get_price_and_meta(
             roe_pct,
             roa_pct,
             equity_ratio_pct,
-        ) = get_us_fundamentals_alpha(ticker)
+        ) = fundamentals
 
-    ticker_obj = yf.Ticker(ticker)
-    company_name = _get_company_name(ticker_obj, ticker)
-    dividend_yield = _compute_dividend_yield(ticker_obj, close)
+    # 会社名は IRBANK / Alpha がキャッシュを埋めた後に引く（ヒットすれば .info を叩かない）
+    company_name = _get_company_name(yf.Ticker(ticker), ticker)
+    dividend_yield = _compute_dividend_yield_from_series(divs, close)
 
     return {
-        "df": df,
-        "close_col": close_col,
-        "close": close,
-        "previous_close": previous_close,
-        "high_52w": high_52w,
-        "low_52w": low_52w,
+        **prices,
         "company_name": company_name,
         "dividend_yield": dividend_yield,
         "eps": eps,
@@ -439,3 +961,63 @@ def get_price_and_meta(
         "roa": roa_pct,
         "equity_ratio": equity_ratio_pct,
     }
+
+
+def _build_price_and_meta(ticker: str, df: pd.DataFrame) -> dict:
+    """
+    取得済みの OHLCV を検証し、銘柄名・配当・ファンダメンタルを付けて返す。
+    """
+    return _attach_meta(ticker, _price_fields(df))
+
+
+@st.cache_data(ttl=PRICE_TTL, show_spinner=False)
+def _load_price_fields(ticker: str, period: str, interval: str) -> dict:
+    """
+    単一銘柄の OHLCV を取得して _price_fields にかける（価格部分だけキャッシュ）。
+    """
+    df = _history_prices(yf.Ticker(ticker), period, interval)
+    return _price_fields(df)
+
+
+def get_price_and_meta(
+    ticker: str,
+    period: str = "180d",
+    interval: str = "1d",
+):
+    """
+    - yfinance.Ticker.history(actions=True) で OHLCV + 配当（リトライ付き）
+    - 銘柄名・配当（期間が 1 年未満なら Ticker.dividends）
+    - JPX: IRBANK から EPS/BPS/PER予/ROE/ROA/自己資本比率
+    - US:  Alpha Vantage から EPS/BPS/ROE/ROA/自己資本比率(近似)
+
+    PRICE_TTL でキャッシュするのは価格部分だけ。ファンダメンタルは
+    取得関数ごとのキャッシュに任せるので、取得失敗の None が 15 分残ることはない。
+    """
+    return _attach_meta(ticker, _load_price_fields(ticker, period, interval))
+
+
+def get_price_and_meta_many(
+    tickers: List[str],
+    period: str = "180d",
+    interval: str = "1d",
+) -> Dict[str, dict]:
+    """
+    ウォッチリスト向け：価格は get_prices_bulk で一括取得し、
+    銘柄ごとのメタ情報・ファンダメンタルは並列に取得する。
+
+    検証に失敗した銘柄（ValueError）はログを出して結果から外す。
+    """
+    frames = get_prices_bulk(tickers, period, interval)
+
+    results: Dict[str, dict] = {}
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = {
+            t: pool.submit(_build_price_and_meta, t, df) for t, df in frames.items()
+        }
+        for t, fut in futures.items():
+            try:
+                results[t] = fut.result()
+            except ValueError as e:
+                print(f"[meta] skipped ({t}): {e}")
+
+    return results
@@ -12,23 +12,157 @@ UI 側（ヘッダー / Qタブ / Tタブ / QVTタブ）は、このモジュー
 dict（tech）だけを見ればよい。
 """
 
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple
 
+import numpy as np
 import pandas as pd
 
 from modules.t_logic import compute_t_metrics
 
+__all__ = [
+    "calc_moving_averages",
+    "calc_bollinger_bands",
+    "calc_rsi",
+    "calc_slope",
+    "slope_arrow",
+    "compute_indicators",
+    "compute_indicators_many",
+]
+
 
 # -----------------------------------------------------------
 # 単純テクニカル計算
 # -----------------------------------------------------------
 
 
+# 累積和（先頭 0 付き）・二乗の累積和・NaN 個数の累積・中心化に使った基準値（列ごと）
+# 以下の配列ヘルパーはすべて axis=0（時間方向）で計算するので、
+# 1 銘柄の (T,) 配列でも複数銘柄を並べた (T, N) 行列でもそのまま使える。
+_PrefixSums = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def _prefix_sums(values: np.ndarray, center: bool = True) -> _PrefixSums:
+    """
+    移動平均 / 移動標準偏差を窓幅ごとに O(n) で出すための累積和をまとめて作る。
+
+    - 桁落ちを抑えるため、最初の有効値を引いて中心化してから累積する
+      （RSI の上昇幅 / 下落幅のように 0 が厳密に 0 で出てほしい系列は center=False）
+    - NaN は 0 として足し、別に NaN の個数を累積しておく（窓内に NaN があれば結果も NaN）
+    """
+    nan_mask = np.isnan(values)
+    ref = np.zeros(values.shape[1:])
+    if center:
+        # 列ごとの最初の有効値（全部 NaN の列は 0 のまま）
+        first = np.expand_dims(np.argmax(~nan_mask, axis=0), 0)
+        ref = np.take_along_axis(values, first, axis=0)[0]
+        ref = np.where(np.isnan(ref), 0.0, ref)
+    centered = np.where(nan_mask, 0.0, values - ref)
+
+    shape = (values.shape[0] + 1,) + values.shape[1:]
+    cs = np.zeros(shape)
+    cs2 = np.zeros(shape)
+    nan_cs = np.zeros(shape, dtype=np.int64)
+    np.cumsum(centered, axis=0, out=cs[1:])
+    np.cumsum(centered * centered, axis=0, out=cs2[1:])
+    np.cumsum(nan_mask, axis=0, out=nan_cs[1:])
+    return cs, cs2, nan_cs, ref
+
+
+def _window_diff(cs: np.ndarray, window: int) -> np.ndarray:
+    """累積和の差分で、末尾が i 本目になる窓の合計を返す（長さ n - window + 1）。"""
+    return cs[window:] - cs[:-window]
+
+
+def _rolling_mean_np(sums: _PrefixSums, window: int) -> np.ndarray:
+    """pandas の rolling(window).mean() と同じ位置に値が入る移動平均。"""
+    cs, _, nan_cs, ref = sums
+    out = np.full((cs.shape[0] - 1,) + cs.shape[1:], np.nan)
+    if window <= out.shape[0]:
+        mean = _window_diff(cs, window) / window + ref
+        has_nan = _window_diff(nan_cs, window) > 0
+        out[window - 1:] = np.where(has_nan, np.nan, mean)
+    return out
+
+
+def _rolling_std_np(sums: _PrefixSums, window: int) -> np.ndarray:
+    """pandas の rolling(window).std() と同じ不偏標準偏差（ddof=1）。"""
+    cs, cs2, nan_cs, _ = sums
+    out = np.full((cs.shape[0] - 1,) + cs.shape[1:], np.nan)
+    if 1 < window <= out.shape[0]:
+        s1 = _window_diff(cs, window)
+        s2 = _window_diff(cs2, window)
+        var = np.maximum((s2 - s1 * s1 / window) / (window - 1), 0.0)
+        has_nan = _window_diff(nan_cs, window) > 0
+        out[window - 1:] = np.where(has_nan, np.nan, np.sqrt(var))
+    return out
+
+
+def _rsi_np(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    標準的な RSI（上昇幅 / 下落幅の単純移動平均による Cutler 型）。
+    中間の Series は作らず、numpy 配列と累積和だけで計算する。
+    """
+    delta = np.empty(close.shape)
+    delta[0] = np.nan
+    np.subtract(close[1:], close[:-1], out=delta[1:])
+
+    # 上昇幅は新しい配列に取り、下落幅は delta のバッファをそのまま使い回す
+    gain = np.maximum(delta, 0.0)
+    loss = np.maximum(np.negative(delta, out=delta), 0.0, out=delta)
+
+    avg_gain = _rolling_mean_np(_prefix_sums(gain, center=False), period)
+    avg_loss = _rolling_mean_np(_prefix_sums(loss, center=False), period)
+    # ゼロ割り回避。下落幅の累積和は単調非減少なので窓の合計は 0 以上になり、
+    # 0 を 1e-10 に置き換えるのと実質同じ（NaN はそのまま残る）
+    np.maximum(avg_loss, 1e-10, out=avg_loss)
+
+    # rs → RSI も avg_gain のバッファ上で順に計算する（100 - 100 / (1 + rs)）
+    rsi = np.divide(avg_gain, avg_loss, out=avg_gain)
+    rsi += 1
+    np.divide(100.0, rsi, out=rsi)
+    return np.subtract(100.0, rsi, out=rsi)
+
+
+# BB の列名と σ の倍率（_bollinger_bands の最後の軸の並び）
+_BB_COLUMNS = ("BB_+1σ", "BB_+2σ", "BB_-1σ", "BB_-2σ")
+_BB_SIGMAS = np.array([1.0, 2.0, -1.0, -2.0])
+
+
+def _bollinger_bands(ma: np.ndarray, std: np.ndarray) -> np.ndarray:
+    """20MA と 20STD から ±1σ / ±2σ の 4 本を 1 回の演算で作る（最後の軸が _BB_COLUMNS の順）。"""
+    return ma[..., None] + std[..., None] * _BB_SIGMAS
+
+
+def _indicator_arrays(close: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    終値配列から MA / BB / RSI をまとめて計算し、列名 → 配列の dict で返す。
+    MA と BB は同じ累積和を使い回す。
+    """
+    sums = _prefix_sums(close)
+    ma_20 = _rolling_mean_np(sums, 20)
+    std_20 = _rolling_std_np(sums, 20)
+    bands = _bollinger_bands(ma_20, std_20)
+
+    arrays = {
+        "25MA": _rolling_mean_np(sums, 25),
+        "50MA": _rolling_mean_np(sums, 50),
+        "75MA": _rolling_mean_np(sums, 75),
+        "20MA": ma_20,
+        "20STD": std_20,
+    }
+    for k, col in enumerate(_BB_COLUMNS):
+        arrays[col] = bands[..., k]
+    arrays["RSI"] = _rsi_np(close)
+    return arrays
+
+
 def calc_moving_averages(df: pd.DataFrame, close_col: str) -> pd.DataFrame:
-    """25 / 50 / 75 日移動平均を追加する。"""
-    df["25MA"] = df[close_col].rolling(25).mean()
-    df["50MA"] = df[close_col].rolling(50).mean()
-    df["75MA"] = df[close_col].rolling(75).mean()
+    """25 / 50 / 75 日移動平均を追加する（累積和 1 回で 3 本とも出す）。"""
+    sums = _prefix_sums(df[close_col].to_numpy(dtype=np.float64))
+    df["25MA"] = _rolling_mean_np(sums, 25)
+    df["50MA"] = _rolling_mean_np(sums, 50)
+    df["75MA"] = _rolling_mean_np(sums, 75)
     return df
 
 
@@ -38,28 +172,62 @@ def calc_bollinger_bands(df: pd.DataFrame, close_col: str) -> pd.DataFrame:
 
     - BB_+1σ, BB_+2σ, BB_-1σ, BB_-2σ
     """
-    df["20MA"] = df[close_col].rolling(20).mean()
-    df["20STD"] = df[close_col].rolling(20).std()
+    sums = _prefix_sums(df[close_col].to_numpy(dtype=np.float64))
+    ma = _rolling_mean_np(sums, 20)
+    std = _rolling_std_np(sums, 20)
 
-    df["BB_+1σ"] = df["20MA"] + df["20STD"]
-    df["BB_+2σ"] = df["20MA"] + 2 * df["20STD"]
-    df["BB_-1σ"] = df["20MA"] - df["20STD"]
-    df["BB_-2σ"] = df["20MA"] - 2 * df["20STD"]
+    df["20MA"] = ma
+    df["20STD"] = std
+    df[list(_BB_COLUMNS)] = _bollinger_bands(ma, std)
     return df
 
 
 def calc_rsi(df: pd.DataFrame, close_col: str, period: int = 14) -> pd.DataFrame:
     """標準的な RSI を計算して 'RSI' 列に追加。"""
-    delta = df[close_col].diff()
-    gain = delta.clip(lower=0)
-    loss = -delta.clip(upper=0)
+    df["RSI"] = _rsi_np(df[close_col].to_numpy(dtype=np.float64), period)
+    return df
 
-    avg_gain = gain.rolling(period).mean()
-    avg_loss = loss.rolling(period).mean().replace(0, 1e-10)
 
-    rs = avg_gain / avg_loss
-    df["RSI"] = 100 - (100 / (1 + rs))
-    return df
+def _tail_valid(values: np.ndarray, count: int) -> np.ndarray:
+    """
+    NaN を除いた末尾 count 本を古い順で返す（足りなければあるだけ）。
+    MA 列は末尾に NaN が無いのが普通なので末尾スライスだけを見て、
+    欠損で足りないときだけ見る範囲を倍々に広げる（配列全体は必要になるまで触らない）。
+    """
+    span = count
+    while True:
+        tail = values[-span:]
+        valid = tail[~np.isnan(tail)]
+        if valid.size >= count or span >= values.size:
+            return valid[-count:]
+        span *= 2
+
+
+# 差分の符号 → 矢印（0: 横ばい, 1: 上向き, 2: 下向き）
+_ARROWS = ("→", "↗", "↘")
+
+
+def _slope_from_tail(tail: np.ndarray, window: int) -> float:
+    if tail.size < window + 1:
+        return 0.0
+    start = float(tail[-window - 1])
+    end = float(tail[-1])
+    if start == 0:
+        return 0.0
+    return (end - start) / start * 100.0
+
+
+def _arrow_from_tail(tail: np.ndarray) -> str:
+    if tail.size < 2:
+        return "→"
+    diff = float(tail[-1]) - float(tail[-2])
+    return _ARROWS[(diff > 0) + 2 * (diff < 0)]
+
+
+def _slope_and_arrow(values: np.ndarray, window: int = 4) -> Tuple[float, str]:
+    """MA 配列の末尾を 1 回だけ拾って、傾き（%）と矢印をまとめて返す。"""
+    tail = _tail_valid(values, window + 1)
+    return _slope_from_tail(tail, window), _arrow_from_tail(tail)
 
 
 def calc_slope(series: pd.Series, window: int = 4) -> float:
@@ -68,38 +236,28 @@ def calc_slope(series: pd.Series, window: int = 4) -> float:
     - 正: 上向き
     - 負: 下向き
     """
-    s = series.dropna()
-    if len(s) < window + 1:
-        return 0.0
-    start = float(s.iloc[-window - 1])
-    end = float(s.iloc[-1])
-    if start == 0:
-        return 0.0
-    return (end - start) / start * 100.0
+    return _slope_from_tail(
+        _tail_valid(series.to_numpy(dtype=np.float64), window + 1), window
+    )
 
 
 def slope_arrow(series: pd.Series) -> str:
     """直近2本の変化方向から矢印アイコンを返す。"""
-    s = series.dropna()
-    if len(s) < 2:
-        return "→"
-    diff = float(s.iloc[-1]) - float(s.iloc[-2])
-    if diff > 0:
-        return "↗"
-    elif diff < 0:
-        return "↘"
-    return "→"
+    return _arrow_from_tail(_tail_valid(series.to_numpy(dtype=np.float64), 2))
 
 
 # -----------------------------------------------------------
 # Q / V スコア用の簡易ユーティリティ
 # -----------------------------------------------------------
+# スコア関数は入力（float / None）だけで決まる純関数なので、同じ値の組はキャッシュから返す。
+# 丸めてからキーにすると線形マップの結果が変わるため、入力はそのままキーにする。
 
 
 def _clamp(x: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, x))
 
 
+@lru_cache(maxsize=4096)
 def _score_quality(
     roe: Optional[float],
     roa: Optional[float],
@@ -130,6 +288,7 @@ def _score_quality(
     return round(sum(scores) / len(scores), 1)
 
 
+@lru_cache(maxsize=4096)
 def _score_valuation(
     per: Optional[float],
     pbr: Optional[float],
@@ -168,6 +327,39 @@ def _score_valuation(
 # メイン：compute_indicators
 # -----------------------------------------------------------
 
+# 最終行の判定に使う指標列（終値と合わせて全部埋まっている行だけを有効とみなす）
+_REQUIRED_COLUMNS = (
+    "25MA",
+    "50MA",
+    "75MA",
+    "BB_+1σ",
+    "BB_+2σ",
+    "BB_-1σ",
+    "BB_-2σ",
+    "RSI",
+)
+
+# 終値に欠損が無いときに指標が埋まり始める行（最長窓 75MA の 75 本目、RSI 14 / BB 20 はそれより前に埋まる）
+_WARMUP_ROWS = 75 - 1
+
+# 最終行の値だけを出すのに要る末尾の本数（75MA が 5 本 = 傾き 4 本分 + 有効行 5 行を満たす長さ）
+_LOOKBACK_ROWS = _WARMUP_ROWS + 5
+
+
+def _valid_rows(close: np.ndarray, arrays: Dict[str, np.ndarray]) -> np.ndarray:
+    """終値とテクニカルがすべて埋まっている行の位置を返す（5 行未満なら ValueError）。"""
+    if np.isfinite(close).all():
+        # 欠損の無い終値なら、最長の 75MA が埋まる行以降がすべて有効（各列の NaN を見に行かない）
+        valid_idx = np.arange(_WARMUP_ROWS, close.size)
+    else:
+        valid = ~np.isnan(close)
+        for col in _REQUIRED_COLUMNS:
+            valid &= ~np.isnan(arrays[col])
+        valid_idx = np.flatnonzero(valid)
+    if valid_idx.size < 5:
+        raise ValueError("テクニカル指標を計算するためのデータが不足しています。")
+    return valid_idx
+
 
 def compute_indicators(
     df: pd.DataFrame,
@@ -182,6 +374,7 @@ def compute_indicators(
     roa: Optional[float] = None,
     equity_ratio: Optional[float] = None,
     dividend_yield: Optional[float] = None,
+    with_columns: bool = False,
 ) -> Dict[str, Any]:
     """
     テクニカル指標 + Q/V/T スコアをまとめて計算し、UI 用の dict を返す。
@@ -189,52 +382,215 @@ def compute_indicators(
     - MA / BB / RSI / slope / arrow などの「数値」はこのモジュールで計算
     - T 周り（押し目判定 / Tスコア / モード / コメント）は t_logic に委譲
     - Q / V スコアはここで算出
+
+    指標は numpy 配列で計算し、最終行の値だけを取り出す。引数の df は変更しない。
+    既定では指標列は作らず、result["df"] は渡された df のまま・result["df_valid"] は None。
+    チャート等で列が要るときだけ with_columns=True にすると、
+    指標列を付けたコピーと有効行だけの df_valid を返す。
     """
 
-    # --- テクニカル計算 ---
-    df = calc_moving_averages(df, close_col)
-    df = calc_bollinger_bands(df, close_col)
-    df = calc_rsi(df, close_col)
-
-    # 有効データ（テクニカルがすべて埋まっている行）
-    df_valid = df.dropna(
-        subset=[
-            close_col,
-            "25MA",
-            "50MA",
-            "75MA",
-            "BB_+1σ",
-            "BB_+2σ",
-            "BB_-1σ",
-            "BB_-2σ",
-            "RSI",
-        ]
+    # --- テクニカル計算（終値は 1 回だけ numpy 配列にする） ---
+    close = df[close_col].to_numpy(dtype=np.float64)
+
+    if not with_columns:
+        # 最終行の値だけで済む場合は、同じ終値列 + ファンダ値の組をキャッシュから返す
+        # （Streamlit はウィジェット操作のたびに再実行されるので、同じ入力が何度も来る）
+        result = dict(
+            _compute_last_cached(
+                close.tobytes(),
+                high_52w,
+                low_52w,
+                eps,
+                bps,
+                eps_fwd,
+                per_fwd,
+                roe,
+                roa,
+                equity_ratio,
+                dividend_yield,
+            )
+        )
+        result["df"] = df
+        return result
+
+    arrays = _indicator_arrays(close)
+    valid_idx = _valid_rows(close, arrays)
+
+    # 呼び出し元の df は書き換えず、指標列を 1 回の concat で付けた新しい df を返す
+    # （列を 1 本ずつ代入するとブロックの再構成が毎回走る）
+    df = pd.concat(
+        [
+            df.drop(columns=[c for c in arrays if c in df.columns]),
+            pd.DataFrame(arrays, index=df.index),
+        ],
+        axis=1,
+    )
+    df_valid = df.iloc[valid_idx]
+
+    return _summarize_indicators(
+        close,
+        arrays,
+        int(valid_idx[-1]),
+        df=df,
+        df_valid=df_valid,
+        high_52w=high_52w,
+        low_52w=low_52w,
+        eps=eps,
+        bps=bps,
+        eps_fwd=eps_fwd,
+        per_fwd=per_fwd,
+        roe=roe,
+        roa=roa,
+        equity_ratio=equity_ratio,
+        dividend_yield=dividend_yield,
     )
-    if df_valid.empty or len(df_valid) < 5:
-        raise ValueError("テクニカル指標を計算するためのデータが不足しています。")
 
-    last = df_valid.iloc[-1]
+
+@lru_cache(maxsize=256)
+def _compute_last_cached(
+    close_bytes: bytes,
+    high_52w: Optional[float],
+    low_52w: Optional[float],
+    eps: Optional[float],
+    bps: Optional[float],
+    eps_fwd: Optional[float],
+    per_fwd: Optional[float],
+    roe: Optional[float],
+    roa: Optional[float],
+    equity_ratio: Optional[float],
+    dividend_yield: Optional[float],
+) -> Dict[str, Any]:
+    """
+    compute_indicators(with_columns=False) の本体。終値列はバイト列ごとキーにする
+    （MA75 や有効行の判定は全期間に依存するので、末尾だけをキーにはできない）。
+    戻り値はキャッシュと共有されるので、呼び出し側はコピーしてから使う。
+    """
+    close = np.frombuffer(close_bytes, dtype=np.float64)
+
+    # 末尾 _LOOKBACK_ROWS 本に欠損が無ければ、最終行・傾き・矢印はその区間だけで決まる
+    # （それより前の値は窓に入らない）ので、全期間ではなく末尾だけで計算する
+    tail = close[-_LOOKBACK_ROWS:]
+    if tail.size == _LOOKBACK_ROWS and np.isfinite(tail).all():
+        close = tail
+
+    arrays = _indicator_arrays(close)
+    valid_idx = _valid_rows(close, arrays)
+    return _summarize_indicators(
+        close,
+        arrays,
+        int(valid_idx[-1]),
+        df=None,
+        df_valid=None,
+        high_52w=high_52w,
+        low_52w=low_52w,
+        eps=eps,
+        bps=bps,
+        eps_fwd=eps_fwd,
+        per_fwd=per_fwd,
+        roe=roe,
+        roa=roa,
+        equity_ratio=equity_ratio,
+        dividend_yield=dividend_yield,
+    )
+
+
+def compute_indicators_many(bases: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    ウォッチリスト向け：get_price_and_meta_many の結果をまとめて計算する。
+
+    各銘柄の終値を末尾揃え（短い銘柄は先頭を NaN で埋める）の (T, N) 行列にして
+    MA / BB / RSI を 1 回で計算し、最終行の解釈・スコアだけ銘柄ごとに行う。
+    先頭の NaN は「履歴が短い」のと同じ扱いになるので、結果は compute_indicators と一致する。
+    データ不足の銘柄（ValueError）はログを出して結果から外す。
+    """
+    if not bases:
+        return {}
+
+    tickers = list(bases)
+    series = [
+        bases[t]["df"][bases[t]["close_col"]].to_numpy(dtype=np.float64)
+        for t in tickers
+    ]
+    length = max(s.size for s in series)
+    closes = np.full((length, len(tickers)), np.nan)
+    for j, s in enumerate(series):
+        closes[length - s.size:, j] = s
+
+    # 全銘柄の末尾 _LOOKBACK_ROWS 本が埋まっていれば、行列もその区間だけで計算する
+    # （_compute_last_cached と同じ理由で最終行の値は変わらない）
+    tail = closes[-_LOOKBACK_ROWS:]
+    if tail.shape[0] == _LOOKBACK_ROWS and np.isfinite(tail).all():
+        closes = tail
+
+    arrays = _indicator_arrays(closes)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for j, t in enumerate(tickers):
+        base = bases[t]
+        close = closes[:, j]
+        columns = {col: values[:, j] for col, values in arrays.items()}
+        try:
+            valid_idx = _valid_rows(close, columns)
+        except ValueError as e:
+            print(f"[indicators] skipped ({t}): {e}")
+            continue
+
+        results[t] = _summarize_indicators(
+            close,
+            columns,
+            int(valid_idx[-1]),
+            df=base["df"],
+            df_valid=None,
+            high_52w=base.get("high_52w"),
+            low_52w=base.get("low_52w"),
+            eps=base.get("eps"),
+            bps=base.get("bps"),
+            eps_fwd=base.get("eps_fwd"),
+            per_fwd=base.get("per_fwd"),
+            roe=base.get("roe"),
+            roa=base.get("roa"),
+            equity_ratio=base.get("equity_ratio"),
+            dividend_yield=base.get("dividend_yield"),
+        )
+
+    return results
+
+
+def _summarize_indicators(
+    close: np.ndarray,
+    arrays: Dict[str, np.ndarray],
+    last: int,
+    df: Optional[pd.DataFrame],
+    df_valid: Optional[pd.DataFrame],
+    high_52w: Optional[float],
+    low_52w: Optional[float],
+    eps: Optional[float],
+    bps: Optional[float],
+    eps_fwd: Optional[float],
+    per_fwd: Optional[float],
+    roe: Optional[float],
+    roa: Optional[float],
+    equity_ratio: Optional[float],
+    dividend_yield: Optional[float],
+) -> Dict[str, Any]:
+    """指標配列の last 行目を取り出し、T 判定と Q / V / QVT スコアを付けて返却 dict を組み立てる。"""
 
     # --- 基本値 ---
-    price = float(last[close_col])
-    ma_25 = float(last["25MA"])
-    ma_50 = float(last["50MA"])
-    ma_75 = float(last["75MA"])
-    rsi = float(last["RSI"])
+    price = float(close[last])
+    ma_25 = float(arrays["25MA"][last])
+    ma_50 = float(arrays["50MA"][last])
+    ma_75 = float(arrays["75MA"][last])
+    rsi = float(arrays["RSI"][last])
 
-    bb_plus1 = float(last["BB_+1σ"])
-    bb_plus2 = float(last["BB_+2σ"])
-    bb_minus1 = float(last["BB_-1σ"])
-    bb_minus2 = float(last["BB_-2σ"])
+    bb_plus1 = float(arrays["BB_+1σ"][last])
+    bb_plus2 = float(arrays["BB_+2σ"][last])
+    bb_minus1 = float(arrays["BB_-1σ"][last])
+    bb_minus2 = float(arrays["BB_-2σ"][last])
 
     # --- 傾き & 矢印 ---
-    slope_25 = calc_slope(df["25MA"])
-    slope_50 = calc_slope(df["50MA"])
-    slope_75 = calc_slope(df["75MA"])
-
-    arrow_25 = slope_arrow(df["25MA"])
-    arrow_50 = slope_arrow(df["50MA"])
-    arrow_75 = slope_arrow(df["75MA"])
+    slope_25, arrow_25 = _slope_and_arrow(arrays["25MA"])
+    slope_50, arrow_50 = _slope_and_arrow(arrays["50MA"])
+    slope_75, arrow_75 = _slope_and_arrow(arrays["75MA"])
 
     # --- PER / PBR / 予想PER ---
     per: Optional[float] = None
@@ -10,10 +10,51 @@ t_logic.py
 - 押し目シグナル
 - T スコア
 - T モード（順張り / 逆張り）とラベル
+- 裁量買いレンジ（目安）
 """
 
+from bisect import bisect_left
 from typing import Tuple, Optional, Dict, Any
 
+__all__ = [
+    "judge_bb_signal",
+    "is_high_price_zone",
+    "is_low_price_zone",
+    "is_flat_ma",
+    "judge_signal",
+    "calc_timing_score",
+    "timing_label_from_score",
+    "buy_range",
+    "compute_t_metrics",
+]
+
+
+# -----------------------------------------------------------
+# 判定結果の定数（テキスト, アイコン, 強度）
+# 毎回タプルやリストを組み立てず、モジュール読み込み時に 1 回だけ作る
+# -----------------------------------------------------------
+
+_BB_OVER_2 = ("非常に割高（+2σ以上）", "🔥", 3)
+_BB_OVER_1 = ("やや割高（+1σ以上）", "📈", 2)
+_BB_UNDER_2 = ("過度に売られすぎ（-2σ以下）", "🧊", 3)
+_BB_UNDER_1 = ("売られ気味（-1σ以下）", "📉", 2)
+_BB_NEUTRAL = ("平均圏（±1σ内）", "⚪️", 1)
+
+_SIGNAL_RSI_UNKNOWN = ("RSI不明", "⚪️", 0)
+_SIGNAL_STRONG = ("バーゲン（強い押し目）", "🔴", 3)
+_SIGNAL_MEDIUM = ("そこそこ押し目", "🟠", 2)
+_SIGNAL_LIGHT = ("軽い押し目", "🟡", 1)
+_SIGNAL_HIGH_PRICE = ("高値圏（要注意！）", "🔥", 0)
+_SIGNAL_NONE = ("押し目シグナルなし", "🟢", 0)
+
+# 順張り / 逆張りの条件成立数（0〜3）→ コメント
+_CONDITION_COMMENTS = (
+    "現時点では見送りが妥当です。",
+    "慎重に検討すべき状況です。",
+    "買い検討の余地があります。",
+    "買い候補として非常に魅力的です。",
+)
+
 
 # -----------------------------------------------------------
 # BB テキスト判定
@@ -28,14 +69,14 @@ def judge_bb_signal(
     bb_minus2: float,
 ) -> Tuple[str, str, int]:
     if price >= bb_plus2:
-        return "非常に割高（+2σ以上）", "🔥", 3
+        return _BB_OVER_2
     elif price >= bb_plus1:
-        return "やや割高（+1σ以上）", "📈", 2
+        return _BB_OVER_1
     elif price <= bb_minus2:
-        return "過度に売られすぎ（-2σ以下）", "🧊", 3
+        return _BB_UNDER_2
     elif price <= bb_minus1:
-        return "売られ気味（-1σ以下）", "📉", 2
-    return "平均圏（±1σ内）", "⚪️", 1
+        return _BB_UNDER_1
+    return _BB_NEUTRAL
 
 
 # -----------------------------------------------------------
@@ -53,19 +94,13 @@ def is_high_price_zone(
     pbr: Optional[float],
     high_52w: Optional[float],
 ) -> int:
-    score = 0
-
-    if price <= ma_25 * 1.10 and price <= ma_50 * 1.10:
-        score += 20
-    if price <= bb_plus1:
-        score += 20
-    if rsi is not None and rsi < 70:
-        score += 15
-    if high_52w and price < high_52w * 0.95:
-        score += 15
-
-    # per / pbr を使った追加ロジックを入れたくなればここに足す余地あり
-    return score
+    # 条件ごとの真偽 × 配点の合計（per / pbr を使った追加ロジックを入れたくなればここに足す余地あり）
+    return (
+        20 * (price <= ma_25 * 1.10 and price <= ma_50 * 1.10)
+        + 20 * (price <= bb_plus1)
+        + 15 * (rsi is not None and rsi < 70)
+        + 15 * bool(high_52w and price < high_52w * 0.95)
+    )
 
 
 # -----------------------------------------------------------
@@ -84,20 +119,13 @@ def is_low_price_zone(
     pbr: Optional[float],
     low_52w: Optional[float],
 ) -> int:
-    score = 0
-
-    if price < ma_25 * 0.90 and price < ma_50 * 0.90:
-        score += 20
-    if price < bb_minus1:
-        score += 15
-    if price < bb_minus2:
-        score += 20
-    if rsi is not None and rsi < 30:
-        score += 15
-    if low_52w and price <= low_52w * 1.05:
-        score += 15
-
-    return score
+    return (
+        20 * (price < ma_25 * 0.90 and price < ma_50 * 0.90)
+        + 15 * (price < bb_minus1)
+        + 20 * (price < bb_minus2)
+        + 15 * (rsi is not None and rsi < 30)
+        + 15 * bool(low_52w and price <= low_52w * 1.05)
+    )
 
 
 # -----------------------------------------------------------
@@ -111,10 +139,14 @@ def is_flat_ma(
     ma_75: float,
     tolerance: float = 0.03,
 ) -> bool:
-    ma_values = [ma_25, ma_50, ma_75]
-    if min(ma_values) == 0:
+    # リストを作らずに 3 本の最小 / 最大を比較だけで出す
+    lo = ma_25 if ma_25 < ma_50 else ma_50
+    lo = lo if lo < ma_75 else ma_75
+    hi = ma_25 if ma_25 > ma_50 else ma_50
+    hi = hi if hi > ma_75 else ma_75
+    if lo == 0:
         return False
-    return (max(ma_values) - min(ma_values)) / max(ma_values) <= tolerance
+    return (hi - lo) / hi <= tolerance
 
 
 # -----------------------------------------------------------
@@ -133,26 +165,33 @@ def judge_signal(
     rsi: Optional[float],
     high_52w: Optional[float],
     low_52w: Optional[float],
+    highprice_score: Optional[int] = None,
 ) -> Tuple[str, str, int]:
+    """
+    押し目シグナルを判定する。
+    highprice_score に is_high_price_zone の結果を渡せば、ここでは再計算しない。
+    """
 
     if rsi is None:
-        return "RSI不明", "⚪️", 0
+        return _SIGNAL_RSI_UNKNOWN
 
     if price <= ma_75 and rsi < 40 and price <= bb_minus1:
-        return "バーゲン（強い押し目）", "🔴", 3
+        return _SIGNAL_STRONG
 
     elif (price <= ma_75 and price < bb_minus1) or (rsi < 30 and price < bb_minus1):
-        return "そこそこ押し目", "🟠", 2
+        return _SIGNAL_MEDIUM
 
     elif price < ma_25 * 0.97 and rsi < 37.5 and price <= bb_minus1:
-        return "軽い押し目", "🟡", 1
+        return _SIGNAL_LIGHT
 
-    elif is_high_price_zone(
-        price, ma_25, ma_50, bb_plus1, rsi, None, None, high_52w
-    ) <= 40:
-        return "高値圏（要注意！）", "🔥", 0
+    if highprice_score is None:
+        highprice_score = is_high_price_zone(
+            price, ma_25, ma_50, bb_plus1, rsi, None, None, high_52w
+        )
+    if highprice_score <= 40:
+        return _SIGNAL_HIGH_PRICE
 
-    return "押し目シグナルなし", "🟢", 0
+    return _SIGNAL_NONE
 
 
 # -----------------------------------------------------------
@@ -221,6 +260,15 @@ def calc_timing_score(
 # Tモード表示用ラベル
 # -----------------------------------------------------------
 
+# bisect_left(_TIMING_EDGES, t) → 0: 〜30, 1: 〜50, 2: 〜80, 3: 80 超（境界値は下の帯に入る）
+_TIMING_EDGES = (30.0, 50.0, 80.0)
+_TIMING_LABELS = (
+    None,  # 30 以下はフラグで文言が変わるので timing_label_from_score 内で決める
+    "押し目シグナルなし〜様子見",
+    "そこそこ押し目",
+    "バーゲン（強い押し目）",
+)
+
 
 def timing_label_from_score(
     t_score: float,
@@ -228,20 +276,39 @@ def timing_label_from_score(
     high_price_alert: bool,
 ) -> str:
 
-    if t_score <= 30:
-        if is_downtrend:
-            return "落ちるナイフ（要注意）"
-        elif high_price_alert:
-            return "高値圏（要注意）"
-        return "タイミング悪化（要注意）"
+    band = bisect_left(_TIMING_EDGES, t_score)
+    if band > 0:
+        return _TIMING_LABELS[band]
 
-    elif t_score <= 50:
-        return "押し目シグナルなし〜様子見"
+    # 30 以下だけは状況によって注意文言を変える
+    if is_downtrend:
+        return "落ちるナイフ（要注意）"
+    elif high_price_alert:
+        return "高値圏（要注意）"
+    return "タイミング悪化（要注意）"
 
-    elif t_score <= 80:
-        return "そこそこ押し目"
 
-    return "バーゲン（強い押し目）"
+# -----------------------------------------------------------
+# 裁量買いレンジ（目安）
+# -----------------------------------------------------------
+
+
+def buy_range(
+    t_mode: str,
+    ma_25: float,
+    ma_50: float,
+    bb_minus1: float,
+) -> Tuple[float, float, float]:
+    """
+    T モードに応じた (中心価格, 下限, 上限) を返す。
+    順張りは 25MA と 50MA の中間、逆張りは 25MA と BB-1σ の中間を中心にとる。
+    """
+    if t_mode == "trend":
+        center = (ma_25 + ma_50) / 2
+        return center, max(center * 0.95, bb_minus1), center * 1.03
+
+    center = (ma_25 + bb_minus1) / 2
+    return center, center * 0.97, center * 1.08
 
 
 # -----------------------------------------------------------
@@ -279,6 +346,14 @@ def compute_t_metrics(
         price, bb_plus1, bb_plus2, bb_minus1, bb_minus2
     )
 
+    # 順張り / 逆張りスコア（高値圏スコアは押し目判定でも使うので先に 1 回だけ出す）
+    highprice_score = is_high_price_zone(
+        price, ma_25, ma_50, bb_plus1, rsi, per, pbr, high_52w
+    )
+    low_score = is_low_price_zone(
+        price, ma_25, ma_50, bb_minus1, bb_minus2, rsi, per, pbr, low_52w
+    )
+
     signal_text, signal_icon, signal_strength = judge_signal(
         price,
         ma_25,
@@ -290,6 +365,7 @@ def compute_t_metrics(
         rsi,
         high_52w,
         low_52w,
+        highprice_score=highprice_score,
     )
 
     # 高値掴みアラート
@@ -301,26 +377,13 @@ def compute_t_metrics(
     ):
         high_price_alert = True
 
-    # 順張り / 逆張りスコア
-    highprice_score = is_high_price_zone(
-        price, ma_25, ma_50, bb_plus1, rsi, per, pbr, high_52w
-    )
-    low_score = is_low_price_zone(
-        price, ma_25, ma_50, bb_minus1, bb_minus2, rsi, per, pbr, low_52w
-    )
-
     trend_conditions = [
         ma_75 < ma_50 < ma_25,
         is_flat_or_gentle_up,
         highprice_score >= 60,
     ]
     trend_ok = sum(trend_conditions)
-    trend_comment = [
-        "現時点では見送りが妥当です。",
-        "慎重に検討すべき状況です。",
-        "買い検討の余地があります。",
-        "買い候補として非常に魅力的です。",
-    ][trend_ok]
+    trend_comment = _CONDITION_COMMENTS[trend_ok]
 
     contrarian_conditions = [
         (ma_75 > ma_50 > ma_25) or is_flat_ma(ma_25, ma_50, ma_75),
@@ -328,12 +391,7 @@ def compute_t_metrics(
         low_score >= 60,
     ]
     contr_ok = sum(contrarian_conditions)
-    contr_comment = [
-        "現時点では見送りが妥当です。",
-        "慎重に検討すべき状況です。",
-        "買い検討の余地があります。",
-        "買い候補として非常に魅力的です。",
-    ][contr_ok]
+    contr_comment = _CONDITION_COMMENTS[contr_ok]
 
     # Tスコア本体
     t_score = calc_timing_score(
@@ -365,6 +423,8 @@ def compute_t_metrics(
         high_price_alert=high_price_alert,
     )
 
+    buy_center, buy_lower, buy_upper = buy_range(t_mode, ma_25, ma_50, bb_minus1)
+
     return {
         # Tスコア周り
         "t_score": t_score,
@@ -392,6 +452,11 @@ def compute_t_metrics(
         "contrarian_conditions": contrarian_conditions,
         "contr_comment": contr_comment,
 
+        # 裁量買いレンジ（T タブ表示用）
+        "buy_center": buy_center,
+        "buy_lower": buy_lower,
+        "buy_upper": buy_upper,
+
         # 補助フラグ
         "slope_25": slope_25,
         "slope_ok": slope_ok,
@@ -1,6 +1,10 @@
 import streamlit as st
 
 
+# 前日比での価格の色（下落 / 変わらず / 上昇）
+_PRICE_COLORS = ("green", "black", "red")
+
+
 def setup_page():
     st.set_page_config(
         page_title="買いシグナルチェッカー",
@@ -20,6 +24,11 @@ def _fmt_float(x, digits: int = 2) -> str:
         return "—"
 
 
+def _fmt_times(x) -> str:
+    """PER / PBR 用の「◯倍」表示（None / 0 は「—」）"""
+    return f"{x:.2f}倍" if x else "—"
+
+
 def render_header_block(
     ticker: str,
     company_name: str,
@@ -30,22 +39,13 @@ def render_header_block(
 ):
     """共通ヘッダー（価格・PER/PBR・MA の表示）"""
 
-    # 色判定
-    if close > previous_close:
-        price_color = "red"
-    elif close < previous_close:
-        price_color = "green"
-    else:
-        price_color = "black"
+    # 色判定（下落 / 変わらず / 上昇 → 0 / 1 / 2）
+    price_color = _PRICE_COLORS[(close > previous_close) - (close < previous_close) + 1]
 
     # PER / PBR
-    per_val = tech.get("per")
-    pbr_val = tech.get("pbr")
-    per_fwd_val = tech.get("per_fwd")
-
-    per_str = f"{per_val:.2f}倍" if per_val else "—"
-    pbr_str = f"{pbr_val:.2f}倍" if pbr_val else "—"
-    per_fwd_str = f"{per_fwd_val:.2f}倍" if per_fwd_val else "—"
+    per_str = _fmt_times(tech.get("per"))
+    pbr_str = _fmt_times(tech.get("pbr"))
+    per_fwd_str = _fmt_times(tech.get("per_fwd"))
 
     # ---- ここで MA / 矢印を indicators の命名に合わせて取得 ----
     ma_25 = tech.get("ma_25")
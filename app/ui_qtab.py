@@ -12,7 +12,7 @@ def _fmt_pct(x) -> str:
 def render_q_tab(tech: dict):
     """Q（ビジネスの質）タブ + 補正UI + 解説"""
 
-    q_score = float(tech.get("q_score", 0.0))
+    q_score = tech["q_score"]
     # v_score / t_score はここでは使わないが、将来拡張用に残すならコメントアウトでもOK
     # v_score = float(tech.get("v_score", 0.0))
     # t_score = float(tech.get("t_score", 0.0))
@@ -1,14 +1,26 @@
+from bisect import bisect_right
+
 import streamlit as st
 
 
+# QVT スコア → コメント（50 / 60 / 70 以上で 1 段ずつ上がる）
+_QVT_EDGES = (50, 60, 70)
+_QVT_MESSAGES = (
+    "テーマ性が強くないなら見送りも選択肢。",
+    "悪くないが他候補との比較推奨。",
+    "買い検討レベル。慎重に押し目を狙いたい。",
+    "総合的にとても魅力的な水準（主力候補）。",
+)
+
+
 def render_qvt_tab(tech: dict):
     """QVT（総合）タブ"""
 
-    # 元スコア
-    q = float(tech["q_score"])
-    v = float(tech["v_score"])
-    t = float(tech["t_score"])
-    qvt = float(tech["qvt_score"])
+    # 元スコア（compute_indicators が float で返す）
+    q = tech["q_score"]
+    v = tech["v_score"]
+    t = tech["t_score"]
+    qvt = tech["qvt_score"]
 
     # 🔽 Qタブでの補正結果（あれば）を取得
     corr = st.session_state.get("q_correction_result")
@@ -39,16 +51,7 @@ def render_qvt_tab(tech: dict):
     # 🔽 メッセージ判定は「補正後QVT」があればそちらを使う
     qvt_for_msg = qvt_corr if corr else qvt
 
-    if qvt_for_msg >= 70:
-        msg = "総合的にとても魅力的な水準（主力候補）。"
-    elif qvt_for_msg >= 60:
-        msg = "買い検討レベル。慎重に押し目を狙いたい。"
-    elif qvt_for_msg >= 50:
-        msg = "悪くないが他候補との比較推奨。"
-    else:
-        msg = "テーマ性が強くないなら見送りも選択肢。"
-
-    st.write(msg)
+    st.write(_QVT_MESSAGES[bisect_right(_QVT_EDGES, qvt_for_msg)])
 
     if corr:
         st.caption("※ コメントは補正後QVTスコアをもとに判定しています。")
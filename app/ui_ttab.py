@@ -1,6 +1,10 @@
 import streamlit as st
 
 
+# 条件の成否 → 表示記号（False / True）
+_OX = ("×", "○")
+
+
 def render_t_tab(tech: dict):
     """T（タイミング）タブUI"""
 
@@ -34,14 +38,7 @@ def render_t_tab(tech: dict):
     if is_trend_mode:
         mode_label = "📈 順張り（上昇トレンド押し目狙い）"
 
-        mid_trend_ok = "○" if trend_conditions[0] else "×"
-        short_trend_ok = "○" if trend_conditions[1] else "×"
-        qvt_ok = "○" if qvt_score >= 60 else "×"
-
-        # ★ dict に合わせてキー名を修正
-        center_price = (tech["ma_25"] + tech["ma_50"]) / 2
-        upper_price = center_price * 1.03
-        lower_price = max(center_price * 0.95, tech["bb_minus1"])
+        conditions = trend_conditions
 
         comment_text = tech["trend_comment"]
 
@@ -54,31 +51,33 @@ def render_t_tab(tech: dict):
     else:
         mode_label = "🧮 逆張り（調整局面の押し目狙い）"
 
-        mid_trend_ok = "○" if contrarian_conditions[0] else "×"
-        short_trend_ok = "○" if contrarian_conditions[1] else "×"
-        qvt_ok = "○" if qvt_score >= 60 else "×"
-
-        # ★ こちらも同様にキー名を揃える
-        center_price = (tech["ma_25"] + tech["bb_minus1"]) / 2
-        upper_price = center_price * 1.08
-        lower_price = center_price * 0.97
+        conditions = contrarian_conditions
 
         comment_text = tech["contr_comment"]
 
         mid_trend_text = "下降 or 横ばい（or MA接近）"
         short_trend_text = "MA25 下降"
 
-    # 表示
-    st.markdown(f"**モード**: {mode_label}")
+    mid_trend_ok = _OX[bool(conditions[0])]
+    short_trend_ok = _OX[bool(conditions[1])]
+    qvt_ok = _OX[qvt_score >= 60]
 
+    # 中心価格・レンジは t_logic.buy_range で計算済み
+    center_price = tech["buy_center"]
+    lower_price = tech["buy_lower"]
+    upper_price = tech["buy_upper"]
+
+    # 表示（モード行と条件表は 1 回の markdown で出す）
     st.markdown(
         f"""
-    | 項目 | 内容 | 判定 |
-    |---|---|:---:|
-    | 中期トレンド | {mid_trend_text} | {mid_trend_ok} |
-    | 短期傾向 | {short_trend_text} | {short_trend_ok} |
-    | 総合力 | QVTスコア ≧ 60 | {qvt_ok} |
-        """
+**モード**: {mode_label}
+
+| 項目 | 内容 | 判定 |
+|---|---|:---:|
+| 中期トレンド | {mid_trend_text} | {mid_trend_ok} |
+| 短期傾向 | {short_trend_text} | {short_trend_ok} |
+| 総合力 | QVTスコア ≧ 60 | {qvt_ok} |
+"""
     )
 
     st.markdown(
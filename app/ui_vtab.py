@@ -18,7 +18,7 @@ def _fmt_yield(x) -> str:
 def render_v_tab(tech: dict):
     """V（バリュエーション）タブ UI"""
 
-    v_score = float(tech.get("v_score", 0.0))
+    v_score = tech["v_score"]
 
     per = tech.get("per")
     per_fwd = tech.get("per_fwd")